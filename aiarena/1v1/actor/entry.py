@@ -214,7 +214,7 @@ def _run(
     actor_handler.setLevel(logging.INFO)
 
     # 绑定“ActorMetricsFormatter”（上一步新建的类）
-    actor_handler._handler.setFormatter(ActorMetricsFormatter())
+    actor_handler.setFormatter(ActorMetricsFormatter())
 
     actor_logger.addHandler(actor_handler)
     actor_logger.propagate = False  # 不向父 logger 冒泡，避免重复处理
@@ -224,7 +224,7 @@ def _run(
     print(f"[entry] actor_logger.handlers = {actor_logger.handlers}")
     print(f"[entry] actor_logger.propagate = {actor_logger.propagate}")
     try:
-        inner_fmt = actor_handler._handler.formatter
+        inner_fmt = actor_handler._handlers[0].formatter
         print(f"[entry] inner formatter = {type(inner_fmt).__name__}")
     except Exception as e:
         print("[entry] read inner formatter failed:", e)
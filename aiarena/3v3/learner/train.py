@@ -1,5 +1,8 @@
+import functools
 import os
 import sys
+from collections import namedtuple
+from pathlib import Path
 from absl import flags
 
 from rl_framework.common.logging import logger as LOG
@@ -19,6 +22,69 @@ config_path = os.path.join(os.path.dirname(__file__), "config", "common.conf")
 train_log = "/aiarena/logs/learner/train.log"
 
 
+_Backend = namedtuple(
+    "_Backend",
+    [
+        "NetworkModel",
+        "NetworkDatasetZMQ",
+        "NetworkDatasetRandom",
+        "ModelManager",
+        "Benchmark",
+        "NodeInfo",
+    ],
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _import_pytorch_backend(distributed_backend):
+    from networkmodel.pytorch.NetworkModel import NetworkModel
+    from rl_framework.learner.dataset.network_dataset.pytorch.network_dataset_zmq import (
+        NetworkDataset as NetworkDatasetZMQ,
+    )
+    from rl_framework.learner.dataset.network_dataset.pytorch.network_dataset_random import (
+        NetworkDataset as NetworkDatasetRandom,
+    )
+    from rl_framework.learner.framework.pytorch.model_manager import ModelManager
+    from rl_framework.learner.framework.pytorch.apd_benchmark import Benchmark
+
+    if distributed_backend == "horovod":
+        from rl_framework.learner.framework.pytorch.node_info_hvd import NodeInfo
+    else:
+        from rl_framework.learner.framework.pytorch.node_info_ddp import NodeInfo
+
+    return _Backend(
+        NetworkModel,
+        NetworkDatasetZMQ,
+        NetworkDatasetRandom,
+        ModelManager,
+        Benchmark,
+        NodeInfo,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _import_tensorflow_backend():
+    from networkmodel.tensorflow.NetworkModel import NetworkModel
+    from rl_framework.learner.dataset.network_dataset.tensorflow.network_dataset_zmq import (
+        NetworkDataset as NetworkDatasetZMQ,
+    )
+    from rl_framework.learner.dataset.network_dataset.tensorflow.network_dataset_random import (
+        NetworkDataset as NetworkDatasetRandom,
+    )
+    from rl_framework.learner.framework.tensorflow.model_manager import ModelManager
+    from rl_framework.learner.framework.tensorflow.apd_benchmark import Benchmark
+    from rl_framework.learner.framework.tensorflow.gradient_fusion import NodeInfo
+
+    return _Backend(
+        NetworkModel,
+        NetworkDatasetZMQ,
+        NetworkDatasetRandom,
+        ModelManager,
+        Benchmark,
+        NodeInfo,
+    )
+
+
 def run(model_config, framework_config, single_test):
     """
     model_config: 模型配置
@@ -37,67 +103,45 @@ def _run(model_config, framework_config, single_test):
     kaiwu_info_example()
 
     config_manager = framework_config  # alias
-    os.makedirs(config_manager.save_model_dir, exist_ok=True)
-    os.makedirs(config_manager.train_dir, exist_ok=True)
-    os.makedirs(config_manager.send_model_dir, exist_ok=True)
+    for model_dir in (
+        config_manager.save_model_dir,
+        config_manager.train_dir,
+        config_manager.send_model_dir,
+    ):
+        Path(model_dir).mkdir(parents=True, exist_ok=True)
 
     training_backend = config_manager.backend
     if single_test:
         config_manager.push_to_modelpool = False
 
     if training_backend == "pytorch":
-        from networkmodel.pytorch.NetworkModel import NetworkModel
-        from rl_framework.learner.dataset.network_dataset.pytorch.network_dataset_random import (
-            NetworkDataset as NetworkDatasetRandom,
-        )
-        from rl_framework.learner.dataset.network_dataset.pytorch.network_dataset_zmq import (
-            NetworkDataset as NetworkDatasetZMQ,
-        )
-        from rl_framework.learner.framework.pytorch.apd_benchmark import Benchmark
-        from rl_framework.learner.framework.pytorch.model_manager import ModelManager
-
-        distributed_backend = config_manager.distributed_backend
-        if distributed_backend == "horovod":
-            from rl_framework.learner.framework.pytorch.node_info_hvd import NodeInfo
-        else:
-            from rl_framework.learner.framework.pytorch.node_info_ddp import NodeInfo
-
-        model_manager = ModelManager(
+        backend = _import_pytorch_backend(config_manager.distributed_backend)
+        model_manager = backend.ModelManager(
             config_manager.push_to_modelpool,
             save_checkpoint_dir=config_manager.save_model_dir,
             backup_checkpoint_dir=config_manager.send_model_dir,
             load_optimizer_state=config_manager.load_optimizer_state,
         )
     elif training_backend == "tensorflow":
-        from networkmodel.tensorflow.NetworkModel import NetworkModel
-        from rl_framework.learner.dataset.network_dataset.tensorflow.network_dataset_random import (
-            NetworkDataset as NetworkDatasetRandom,
-        )
-        from rl_framework.learner.dataset.network_dataset.tensorflow.network_dataset_zmq import (
-            NetworkDataset as NetworkDatasetZMQ,
-        )
-        from rl_framework.learner.framework.tensorflow.apd_benchmark import Benchmark
-        from rl_framework.learner.framework.tensorflow.gradient_fusion import NodeInfo
-        from rl_framework.learner.framework.tensorflow.model_manager import ModelManager
-
-        model_manager = ModelManager(config_manager.push_to_modelpool)
+        backend = _import_tensorflow_backend()
+        model_manager = backend.ModelManager(config_manager.push_to_modelpool)
     else:
         raise NotImplementedError(
             "Support backend in [pytorch, tensorflow], Check your training backend..."
         )
 
     adapter = OfflineRlInfoAdapter(model_config.data_shapes)
-    node_info = NodeInfo()
+    node_info = backend.NodeInfo()
 
     if single_test:
-        dataset = NetworkDatasetRandom(config_manager, adapter)
+        dataset = backend.NetworkDatasetRandom(config_manager, adapter)
     else:
-        dataset = NetworkDatasetZMQ(
+        dataset = backend.NetworkDatasetZMQ(
             config_manager, adapter, port=config_manager.ports[node_info.local_rank]
         )
 
-    benchmark = Benchmark(
-        NetworkModel(),
+    benchmark = backend.Benchmark(
+        backend.NetworkModel(),
         dataset,
         LogManager(),
         model_manager,
@@ -1,35 +1,219 @@
-import os
+import atexit
+import copy
+import functools
 import logging
+import socket
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
+from pathlib import Path
+from queue import Empty, Full, Queue
 import subprocess
 import configparser
 import ast
 import time
 import influxdb
+from influxdb.line_protocol import make_line, quote_ident
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 import numbers
 import collections.abc
 
-def _to_builtin(obj):
+# Monitor records are structured dicts and never use the caller, thread or
+# process attributes of a LogRecord. Skip collecting them for every record,
+# _srcfile = None short-circuits Logger.findCaller (a stack walk per record).
+# Note this applies to all stdlib loggers of the process importing this module.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+logger = logging.getLogger(__name__)
+
+_HOSTNAME = socket.gethostname()
+
+
+@functools.lru_cache(maxsize=1)
+def _is_gpu():
+    try:
+        res = subprocess.run(
+            ["nvidia-smi", "-L"],
+            encoding="utf-8",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return res.returncode == 0 and res.stdout != ""
+
+
+_NUMPY_INT_TYPES = (
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+)
+_NUMPY_FLOAT_TYPES = (np.float16, np.float32, np.float64)
+
+
+# 无需转换的类型，容器内直接返回，不产生函数调用
+_PASSTHROUGH_TYPES = frozenset((int, float, str, bool, type(None)))
+
+
+def _identity(obj):
+    return obj
+
+
+# 容器内直接按类型分派，省去每个元素一层 _to_builtin 调用
+def _handle_dict(obj):
+    passthrough = _PASSTHROUGH_TYPES
+    get_handler = _HANDLERS.get
+    return {
+        k: v
+        if type(v) in passthrough
+        else (get_handler(type(v)) or _slow_path)(v)
+        for k, v in obj.items()
+    }
+
+
+def _handle_list(obj):
+    passthrough = _PASSTHROUGH_TYPES
+    get_handler = _HANDLERS.get
+    return [
+        v if type(v) in passthrough else (get_handler(type(v)) or _slow_path)(v)
+        for v in obj
+    ]
+
+
+def _handle_tuple(obj):
+    return tuple(_handle_list(obj))
+
+
+def _handle_ndarray(obj):
+    # tolist() 在 C 层完成转换
+    return obj.tolist()
+
+
+def _handle_numpy_scalar(obj):
+    return obj.item()
+
+
+# 按 type(obj) 分派，一次 dict 查找代替多次 isinstance
+_HANDLERS = {
+    int: _identity,
+    float: _identity,
+    str: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _handle_dict,
+    list: _handle_list,
+    tuple: _handle_tuple,
+    np.ndarray: _handle_ndarray,
+}
+for _t in (np.bool_,) + _NUMPY_INT_TYPES + _NUMPY_FLOAT_TYPES:
+    _HANDLERS[_t] = _handle_numpy_scalar
+
+
+def _slow_path(obj):
     # numpy 标量
-    if isinstance(obj, (np.generic,)):
+    if isinstance(obj, np.generic):
         return obj.item()
-    # 基本数值直接返回
-    if isinstance(obj, numbers.Number) or isinstance(obj, (str, bool)) or obj is None:
+    # 其他数值类型直接返回
+    if isinstance(obj, numbers.Number) or isinstance(obj, (str, bool)):
         return obj
     # 映射类型
     if isinstance(obj, dict):
-        return {k: _to_builtin(v) for k, v in obj.items()}
+        return _handle_dict(obj)
     # 可迭代（list/tuple等）
-    if isinstance(obj, collections.abc.Sequence) and not isinstance(obj, (str, bytes, bytearray)):
-        return type(obj)(_to_builtin(v) for v in obj)
+    if isinstance(obj, collections.abc.Sequence) and not isinstance(
+        obj, (bytes, bytearray)
+    ):
+        return type(obj)(_handle_list(obj))
     # numpy 数组
     if isinstance(obj, np.ndarray):
         return obj.tolist()
     # 其他非常规类型，转字符串以保证可写
     return str(obj)
 
+
+def _to_builtin(obj):
+    handler = _HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    return _slow_path(obj)
+
+
+def _escape_key(key):
+    return (
+        str(key)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+# 按类型格式化 line protocol 字段值，与 influxdb.line_protocol 保持一致
+# numpy 标量直接格式化，无需先经过 _to_builtin
+_FIELD_FORMATTERS = {
+    float: repr,
+    int: "{}i".format,
+    bool: str,
+    str: quote_ident,
+    np.bool_: lambda v: str(bool(v)),
+}
+for _t in _NUMPY_INT_TYPES:
+    _FIELD_FORMATTERS[_t] = lambda v: "{}i".format(int(v))
+for _t in _NUMPY_FLOAT_TYPES:
+    _FIELD_FORMATTERS[_t] = lambda v: repr(float(v))
+
+# 可以直接写入的字段值类型
+_LINE_SCALARS = frozenset(_FIELD_FORMATTERS)
+
+
+def _make_line_formatter(measurement, tags, field_keys):
+    """Build a line protocol formatter for points with a fixed schema
+
+    The measurement/tags prefix and the escaped field keys are computed once,
+    the returned function only formats the field values. Points it cannot
+    format (e.g. None or list values) fall back to influxdb's make_line.
+    """
+    prefix = make_line(measurement, tags=tags)
+    # key=str: sorting never raises on mixed key types. Empty keys are
+    # skipped, the same as make_line does
+    keys = [
+        (key, _escape_key(key) + "=")
+        for key in sorted(field_keys, key=str)
+        if str(key) != ""
+    ]
+    formatters = _FIELD_FORMATTERS
+
+    def format_line(fields, timestamp=None):
+        try:
+            field_str = ",".join(
+                [
+                    escaped + formatters[type(fields[key])](fields[key])
+                    for key, escaped in keys
+                ]
+            )
+        except KeyError:
+            field_str = ""
+        if not field_str:
+            return make_line(
+                measurement, tags=tags, fields=_to_builtin(fields), time=timestamp
+            )
+        if timestamp is None:
+            return f"{prefix} {field_str}"
+        return f"{prefix} {field_str} {timestamp}"
+
+    return format_line
+
+
 class InfluxdbMonitorFilter(logging.Filter):
     def __init__(self):
         super().__init__()
@@ -43,138 +227,468 @@ class InfluxdbMonitorFilter(logging.Filter):
 class InfluxdbMonitorFormatter(logging.Formatter):
     def __init__(self):
         super().__init__()
-        is_gpu = False
-        res = subprocess.run(
-            ["nvidia-smi  -L"], shell=True, encoding="utf-8", stdout=subprocess.PIPE
-        )
-        if res.returncode == 0 and res.stdout != "":
-            is_gpu = True
-        res = subprocess.run(
-            ["hostname"], shell=True, encoding="utf-8", stdout=subprocess.PIPE
-        )
-        hostname = res.stdout.strip()
-        self._json_body = {
-            "measurement": "gpu_ip_info" if is_gpu else "cpu_ip_info",
-            "tags": {
-                "ip_port": hostname,
-                "type": "gpu" if is_gpu else "cpu",
-            },
+        is_gpu = _is_gpu()
+        self._measurement = "gpu_ip_info" if is_gpu else "cpu_ip_info"
+        # tags 在各条记录间共享，不允许修改
+        self._base_tags = {
+            "ip_port": _HOSTNAME,
+            "type": "gpu" if is_gpu else "cpu",
         }
 
     def format(self, record):
         # 1) 直接读取 dict（避免 literal_eval）
-        if isinstance(record.msg, dict):
-            msg_dict = record.msg.copy()
+        msg = record.msg
+        if isinstance(msg, dict):
+            line_scalars = _LINE_SCALARS
+            if all(type(v) in line_scalars for v in msg.values()):
+                # 全部是可直接格式化的标量，无需转换也无需拷贝
+                msg_dict = msg
+            else:
+                # _to_builtin 会构造新的 dict，无需提前 copy
+                msg_dict = _to_builtin(msg)
         else:
             # 兜底：只有在不是 dict 的情况下才尝试解析
-            msg_dict = ast.literal_eval(record.getMessage())
+            msg_dict = _to_builtin(ast.literal_eval(record.getMessage()))
 
-        msg_dict = _to_builtin(msg_dict)
-        # Transfer str message to dict
-        #msg_dict = ast.literal_eval(record.getMessage())
-        self._json_body["fields"] = msg_dict
-        return self._json_body
+        # 每条记录返回新的 dict，避免批量写入时共享同一对象
+        # 使用记录产生的时间，避免批量写入时由服务端统一打上写入时间
+        return {
+            "measurement": self._measurement,
+            "tags": self._base_tags,
+            "fields": msg_dict,
+            "time": int(record.created * 1e9),
+        }
 
 class ActorMetricsFormatter(InfluxdbMonitorFormatter):
     def __init__(self):
         super().__init__()
         # 覆盖 measurement：固定写到 actor_metrics
-        self._json_body["measurement"] = "actor_metrics"
+        self._measurement = "actor_metrics"
 
     def format(self, record):
-        msg_dict = ast.literal_eval(record.getMessage())
+        if isinstance(record.msg, dict):
+            msg_dict = record.msg.copy()
+        else:
+            msg_dict = ast.literal_eval(record.getMessage())
         # 可选：把 role/actor_id 提升为 tag，查询更高效
         role = msg_dict.pop("role", None)
         actor_id = msg_dict.pop("actor_id", None)
+        tags = {**self._base_tags}
         if role:
-            self._json_body["tags"]["role"] = role
+            tags["role"] = role
         if actor_id is not None:
-            self._json_body["tags"]["actor_id"] = str(actor_id)
-        self._json_body["fields"] = msg_dict
-        return self._json_body
+            tags["actor_id"] = str(actor_id)
+        return {
+            "measurement": self._measurement,
+            "tags": tags,
+            "fields": msg_dict,
+            "time": int(record.created * 1e9),
+        }
 
 class InfluxdbMonitorHandlerInner(logging.Handler):
-    def __init__(self, ip, port, database):
+    # Bytes per UDP datagram, below the 65507 bytes UDP payload limit
+    UDP_MAX_BYTES = 60000
+    # 4xx codes a batch is split on, partial write / parse error and payload
+    # too large
+    SPLIT_CODES = (400, 413)
+
+    def __init__(
+        self,
+        ip,
+        port,
+        database,
+        buffer_limit=500,
+        flush_interval=1.0,
+        use_udp=False,
+    ):
         super().__init__()
         self._ip = ip
         self._port = port
         self._database = database
+        self._use_udp = use_udp
         self._client = self._create_influxdb_client()
 
+        # Points are buffered and written in batches, one HTTP request per
+        # flush instead of one per record
+        self._buffer = []
+        self._buffer_limit = buffer_limit
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+        # (measurement, tags, field keys, formatter) of the last point, metrics
+        # are usually logged with the same schema every step
+        self._line_cache = None
+
     def _create_influxdb_client(self):
-        return influxdb.InfluxDBClient(
+        session = requests.Session()
+        client = influxdb.InfluxDBClient(
             host=self._ip,
             port=self._port,
             database=self._database,
             timeout=1,
+            retries=1,
+            use_udp=self._use_udp,
+            udp_port=int(self._port),
+            session=session,
         )
+        # Keep-alive connection, connection level retries are done by urllib3
+        # instead of recreating the client
+        session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+        return client
 
     def emit(self, record):
-        for _ in range(2):
+        try:
+            msg = self.format(record)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "emit to %s:%s db=%s measurement=%s tags=%s fields=%s",
+                    self._ip,
+                    self._port,
+                    self._database,
+                    msg.get("measurement"),
+                    msg.get("tags", {}),
+                    list(msg.get("fields", {}).keys()),
+                )
+            # A point without fields is invalid line protocol, and the server
+            # rejects the whole batch it is written in
+            if not any(
+                v is not None and str(k) != "" for k, v in msg["fields"].items()
+            ):
+                return
+            line = self._to_line(msg)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+
+        self._buffer.append(line)
+        if (
+            len(self._buffer) >= self._buffer_limit
+            or time.monotonic() - self._last_flush > self._flush_interval
+        ):
+            self.flush()
+
+    def _to_line(self, point):
+        measurement = point["measurement"]
+        tags = point["tags"]
+        fields = point["fields"]
+        field_keys = tuple(fields)
+        cache = self._line_cache
+        if (
+            cache is None
+            or cache[2] != field_keys
+            or cache[0] != measurement
+            or cache[1] != tags
+        ):
+            cache = (
+                measurement,
+                tags,
+                field_keys,
+                _make_line_formatter(measurement, tags, field_keys),
+            )
+            self._line_cache = cache
+        return cache[3](fields, point.get("time"))
+
+    def flush(self):
+        self.acquire()
+        try:
+            points, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if not points:
+                return
+            if self._use_udp:
+                self._send_udp(points)
+                return
+            for _ in range(2):
+                try:
+                    self._write_points(points)
+                    break
+                except requests.exceptions.Timeout as e:
+                    # transient, keep the connection and try again. Checked
+                    # first, requests exceptions are also OSError
+                    logger.warning("emit failed: %s", e)
+                except (
+                    influxdb.exceptions.InfluxDBServerError,
+                    requests.exceptions.ConnectionError,
+                ) as e:
+                    # recreate influxdb client and try again
+                    logger.warning("emit failed: %s", e)
+                    self._close_client()
+                    self._client = self._create_influxdb_client()
+                except Exception as e:  # pylint: disable=broad-except
+                    # unexpected error, keep the connection and try again
+                    logger.warning("emit failed: %s", e)
+        finally:
+            self.release()
+
+    def _close_client(self):
+        # InfluxDBClient.close() only closes the http session
+        self._client.close()
+        if self._use_udp:
+            self._client.udp_socket.close()
+
+    def _send_udp(self, points):
+        # Datagrams are not retried, a failed send drops its points only and
+        # never resends the datagrams that already went out
+        for packet in self._udp_packets(points):
             try:
-                msg = self.format(record)
-                # === 新增：把目标和字段打印出来（最关键的一锤定音） ===
-                meas = msg.get("measurement")
-                fields = list(msg.get("fields", {}).keys())
-                tags = msg.get("tags", {})
-                print(f"[emit] to {self._ip}:{self._port} db={self._database} "
-                      f"measurement={meas} tags={tags} fields={fields}")
-
-                self._client.write_points([msg])
-                break
-            except Exception as e:  # pylint: disable=broad-except
-                # recreate influxdb client and try again
-                print("[emit] error:", e)
-                self._client.close()
-                self._client = self._create_influxdb_client()
+                self._client.send_packet(packet, protocol="line")
+            except OSError as e:
+                logger.warning("emit failed, drop %d points: %s", len(packet), e)
+
+    def _udp_packets(self, points):
+        # Split by encoded size, one line plus its newline per point
+        packet = []
+        size = 0
+        for point in points:
+            point_size = len(point.encode("utf-8")) + 1
+            if packet and size + point_size > self.UDP_MAX_BYTES:
+                yield packet
+                packet = []
+                size = 0
+            packet.append(point)
+            size += point_size
+        if packet:
+            yield packet
+
+    def _write_points(self, points):
+        # Points carry their own timestamp, so writing a point twice when the
+        # whole batch is retried only overwrites it with the same values
+        try:
+            self._client.write_points(
+                points,
+                time_precision="n",
+                batch_size=len(points),
+                protocol="line",
+            )
+        except influxdb.exceptions.InfluxDBClientError as e:
+            # 4xx, the request is rejected and retrying it won't help. A parse
+            # error or a too large payload may come from a few points only, split
+            # the batch so that only the bad points are dropped. Any other 4xx
+            # (database not found, auth) fails every point, drop the batch
+            if e.code not in self.SPLIT_CODES:
+                logger.warning("emit failed, drop %d points: %s", len(points), e)
+                return
+            if len(points) == 1:
+                logger.warning("emit failed, drop point %s: %s", points[0], e)
+                return
+            half = len(points) // 2
+            self._write_points(points[:half])
+            self._write_points(points[half:])
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class InfluxdbMonitorQueueHandler(QueueHandler):
+    """QueueHandler that drops the oldest record when the queue is full
+
+    Training code never blocks on the network bound listener. The number of
+    dropped records is reported periodically as a dropped_records field. The
+    report is only enqueued when the queue has room, so it never evicts a
+    record, and the count of an evicted report is carried over to the next.
+    A listener sentinel is never evicted, and records are ignored once the
+    handler is closed so the sentinels enqueued after it stay in the queue.
+    """
+
+    def __init__(self, queue, report_interval=10.0):
+        super().__init__(queue)
+        self._closed = False
+        self._dropped = 0
+        self._report_interval = report_interval
+        self._last_report = time.monotonic()
+
+    def _put(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except Full:
+            pass
+        try:
+            evicted = self.queue.get_nowait()
+        except Empty:
+            pass
+        else:
+            self.queue.task_done()
+            if evicted is InfluxdbMonitorQueueListener._sentinel:
+                # A listener is stopping, put its sentinel back and drop the
+                # new record instead. Blocking, the listeners keep draining
+                self.queue.put(evicted)
+                self._dropped += 1
+                return
+            # An evicted report drops no record, but its count must not be lost
+            self._dropped += getattr(evicted, "dropped_records", 1)
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self._dropped += 1
+
+    def prepare(self, record):
+        # record.msg is a dict (see InfluxdbMonitorFilter) and the queue is an
+        # in-process Queue, so skip QueueHandler's str formatting of the message.
+        # Take a shallow copy so the values are captured at log time, callers
+        # may reuse or mutate the dict after logging it
+        record = copy.copy(record)
+        record.msg = dict(record.msg)
+        return record
+
+    def close(self):
+        # Taken under the handler lock, no record is enqueued once it returns
+        self.acquire()
+        try:
+            self._closed = True
+        finally:
+            self.release()
+        super().close()
+
+    def enqueue(self, record):
+        # Called with the handler lock held
+        if self._closed:
+            return
+        self._put(record)
+        if (
+            self._dropped
+            and time.monotonic() - self._last_report > self._report_interval
+        ):
+            report = logging.makeLogRecord(
+                {
+                    "msg": {"dropped_records": self._dropped},
+                    "dropped_records": self._dropped,
+                }
+            )
+            try:
+                self.queue.put_nowait(report)
+            except Full:
+                # Still full, keep counting and report on a later record
+                return
+            self._dropped = 0
+            self._last_report = time.monotonic()
+
+
+class InfluxdbMonitorQueueListener(QueueListener):
+    """QueueListener that flushes its handlers when the queue stays idle"""
+
+    def __init__(self, queue, *handlers, flush_interval=1.0):
+        super().__init__(queue, *handlers)
+        self._flush_interval = flush_interval
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, self._flush_interval)
+            except Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+    def enqueue_sentinel(self):
+        # The queue may be full, wait for the listener to make room instead
+        # of raising Full
+        self.queue.put(self._sentinel)
+
+    def join(self, timeout=10.0):
+        # Wait for the thread to exit after enqueue_sentinel(), lets several
+        # listeners on one queue be stopped together. Bounded so that a stuck
+        # writer can't hang logging.shutdown() at exit, the thread is a daemon
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("queue listener did not stop in %.1fs", timeout)
+        self._thread = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config():
+    # Parsed once per process, shared by all InfluxdbMonitorHandler instances
+    config = configparser.ConfigParser()
+    config.read(Path(__file__).with_name("loglib.conf"))
+    section = config["influxdb_handler"]
+    return {
+        "queue_size": section.getint("queue_size"),
+        "port": section.getint("port"),
+        "database": section.get("database"),
+        "use_udp": section.getboolean("use_udp", fallback=False),
+        "writer_num": section.getint("writer_num", fallback=1),
+    }
 
 
 class InfluxdbMonitorHandler(logging.Handler):
     def __init__(self, ip, port=None, database=None):
         super().__init__()
-        self._config = self._get_config()
-        self._queue = Queue(self._config.getint("queue_size"))
-        self._queue_handler = QueueHandler(self._queue)
+        self._config = _get_config()
+        self._queue = Queue(self._config["queue_size"])
+        self._queue_handler = InfluxdbMonitorQueueHandler(self._queue)
         if port is None:
-            port = self._config.get("port")
+            port = self._config["port"]
         if database is None:
-            database = self._config.get("database")
-        self._handler = InfluxdbMonitorHandlerInner(ip, port, database)
+            database = self._config["database"]
+        use_udp = self._config["use_udp"]
+        writer_num = self._config["writer_num"]
 
-        # Influxdb Formatter
+        # Influxdb Formatter, shared by the writers
         formatter = InfluxdbMonitorFormatter()
-        self._handler.setFormatter(formatter)
 
-        # Accept dict type log only. QueueHandler will format record message
-        # to str, so add InfluxdbMonitorFilter to queue handler, not dict not enqueue
+        # Accept dict type log only, add InfluxdbMonitorFilter to queue handler,
+        # not dict not enqueue
         filter = InfluxdbMonitorFilter()
         self._queue_handler.addFilter(filter)
 
-        self._queue_listener = QueueListener(self._queue, self._handler)
-        self._queue_listener.start()
+        # Several writers consume the same queue, each with its own listener
+        # thread and influxdb client, so writes to the server overlap
+        self._handlers = []
+        self._queue_listeners = []
+        for _ in range(max(writer_num, 1)):
+            handler = InfluxdbMonitorHandlerInner(ip, port, database, use_udp=use_udp)
+            handler.setFormatter(formatter)
+            listener = InfluxdbMonitorQueueListener(self._queue, handler)
+            listener.start()
+            self._handlers.append(handler)
+            self._queue_listeners.append(listener)
 
-    def _get_config(self):
-        config = configparser.ConfigParser()
-        file_path = os.path.dirname(os.path.realpath(__file__))
-        config.read(os.path.join(file_path, "loglib.conf"))
-        return config["influxdb_handler"]
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+        for handler in self._handlers:
+            handler.setFormatter(fmt)
 
     def emit(self, record):
         self._queue_handler.handle(record)
 
+    def close(self):
+        # Drain the queue before flushing buffered points. Stop accepting
+        # records first so the sentinels can't be evicted, then enqueue all the
+        # sentinels, any listener thread may take any of them
+        self._queue_handler.close()
+        if self._queue_listeners:
+            for listener in self._queue_listeners:
+                listener.enqueue_sentinel()
+            for listener in self._queue_listeners:
+                listener.join()
+            self._queue_listeners = []
+            for handler in self._handlers:
+                handler.flush()
+        super().close()
+
 
 if __name__ == "__main__":
-    logger = logging.get_logger("handler")
-    logger.setLevel(logging.DEBUG)
+    test_logger = logging.getLogger("handler")
+    test_logger.setLevel(logging.DEBUG)
 
     handler = InfluxdbMonitorHandler("localhost")
     handler.setLevel(logging.INFO)
-    logger.addHandler(handler)
-    logger.addHandler(logging.FileHandler("file.log"))
-    logger.debug("hello world")
-    logger.info("hello world")
+    test_logger.addHandler(handler)
+    test_logger.addHandler(logging.FileHandler("file.log"))
+    test_logger.debug("hello world")
+    test_logger.info("hello world")
     data = {"A": 1, "B": 2}
     for _ in range(5):
-        logger.debug(data)
-        logger.info(data)
+        test_logger.debug(data)
+        test_logger.info(data)
     time.sleep(1)
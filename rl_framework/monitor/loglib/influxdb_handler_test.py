@@ -0,0 +1,299 @@
+# -*- coding:utf-8 -*-
+
+import logging
+import queue
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+from influxdb.exceptions import InfluxDBClientError
+from influxdb.line_protocol import make_line
+
+from rl_framework.monitor.loglib import influxdb_handler
+from rl_framework.monitor.loglib.influxdb_handler import (
+    InfluxdbMonitorFormatter,
+    InfluxdbMonitorHandler,
+    InfluxdbMonitorHandlerInner,
+    InfluxdbMonitorQueueHandler,
+    InfluxdbMonitorQueueListener,
+    _make_line_formatter,
+    _to_builtin,
+)
+
+
+class LineFormatterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.measurement = "cpu ip,info"
+        self.tags = {"ip_port": "host 1", "type": "cpu", "a=b": "c,d"}
+        self.timestamp = 1700000000123456789
+
+    def assert_same_as_make_line(self, fields):
+        format_line = _make_line_formatter(self.measurement, self.tags, tuple(fields))
+        expected = make_line(
+            self.measurement,
+            tags=self.tags,
+            fields=_to_builtin(fields),
+            time=self.timestamp,
+        )
+        self.assertEqual(format_line(fields, self.timestamp), expected)
+
+    def test_builtin(self):
+        self.assert_same_as_make_line(
+            {"step": 10, "loss": 0.125, "done": True, "lr": 1e-05, "neg": -3}
+        )
+
+    def test_numpy(self):
+        self.assert_same_as_make_line(
+            {
+                "f16": np.float16(2.5),
+                "f32": np.float32(0.1),
+                "f64": np.float64(1.5),
+                "i8": np.int8(-1),
+                "i64": np.int64(2**40),
+                "u8": np.uint8(255),
+                "b": np.bool_(False),
+            }
+        )
+
+    def test_none(self):
+        self.assert_same_as_make_line({"a": 1.0, "b": None})
+
+    def test_list(self):
+        self.assert_same_as_make_line({"a": 1, "arr": np.arange(3), "l": [1, 2]})
+
+    def test_str_escaping(self):
+        self.assert_same_as_make_line(
+            {"key with space": 'say "hi"\\', "k,=": "line\nbreak", "": 1}
+        )
+
+    def test_empty_fields(self):
+        self.assert_same_as_make_line({})
+
+    def test_mixed_key_types(self):
+        format_line = _make_line_formatter(self.measurement, self.tags, (1, "a"))
+        line = format_line({1: 1.0, "a": 2.0}, self.timestamp)
+        self.assertTrue(line.endswith(" 1=1.0,a=2.0 %d" % self.timestamp))
+
+
+class HandlerInnerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.handler = InfluxdbMonitorHandlerInner("127.0.0.1", 8086, "monitordb")
+        self.handler.setFormatter(InfluxdbMonitorFormatter())
+
+    def tearDown(self) -> None:
+        # Nothing to write at exit, there is no server
+        self.handler._buffer = []
+
+    def emit(self, msg):
+        self.handler.emit(logging.makeLogRecord({"msg": msg}))
+
+    def test_skip_point_without_fields(self):
+        self.emit({})
+        self.emit({"a": None})
+        self.emit({"": 1})
+        self.assertEqual(self.handler._buffer, [])
+
+    def test_bad_point_does_not_raise(self):
+        self.emit({1: 1.0, "a": None})
+        self.emit({"a": 1})
+        self.assertEqual(len(self.handler._buffer), 1)
+        self.assertIn(" a=1i ", self.handler._buffer[0])
+
+
+class _RejectingClient:
+    """Client stub that rejects every batch holding a bad point"""
+
+    def __init__(self, code, bad):
+        self.code = code
+        self.bad = bad
+        self.requests = []
+        self.written = []
+
+    def write_points(self, points, **kwargs):
+        self.requests.append(list(points))
+        if self.bad & set(points):
+            raise InfluxDBClientError("rejected", self.code)
+        self.written.extend(points)
+
+
+class WritePointsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.handler = InfluxdbMonitorHandlerInner("127.0.0.1", 8086, "monitordb")
+        self.points = ["p%d" % i for i in range(8)]
+
+    def write(self, code, bad):
+        self.handler._client = _RejectingClient(code, bad)
+        with self.assertLogs("rl_framework.monitor.loglib.influxdb_handler") as logs:
+            self.handler._write_points(self.points)
+        return self.handler._client, logs.output
+
+    def test_split_on_bad_points(self):
+        for code in (400, 413):
+            client, output = self.write(code, {"p2", "p5"})
+            self.assertEqual(
+                client.written, [p for p in self.points if p not in ("p2", "p5")]
+            )
+            self.assertEqual(len(output), 2)
+
+    def test_drop_batch_when_every_point_fails(self):
+        for code in (401, 403, 404):
+            client, output = self.write(code, set(self.points))
+            self.assertEqual(client.requests, [self.points])
+            self.assertEqual(client.written, [])
+            self.assertEqual(len(output), 1)
+
+
+class QueueHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queue = queue.Queue(3)
+        self.handler = InfluxdbMonitorQueueHandler(self.queue, report_interval=1e9)
+
+    def log(self, msg):
+        self.handler.handle(logging.makeLogRecord({"msg": msg}))
+
+    def queued(self):
+        return [record.msg for record in list(self.queue.queue)]
+
+    def test_drop_oldest(self):
+        for i in range(5):
+            self.log({"i": i})
+        self.assertEqual(self.queued(), [{"i": 2}, {"i": 3}, {"i": 4}])
+        self.assertEqual(self.handler._dropped, 2)
+
+    def test_report_never_evicts(self):
+        for i in range(5):
+            self.log({"i": i})
+        self.handler._report_interval = 0
+        # Still full after enqueueing, the report waits
+        self.log({"i": 5})
+        self.assertEqual(self.queued(), [{"i": 3}, {"i": 4}, {"i": 5}])
+        self.assertEqual(self.handler._dropped, 3)
+
+        self.queue.get_nowait()
+        self.queue.get_nowait()
+        self.log({"i": 6})
+        self.assertEqual(self.queued(), [{"i": 5}, {"i": 6}, {"dropped_records": 3}])
+        self.assertEqual(self.handler._dropped, 0)
+
+    def test_evicted_report_count_is_kept(self):
+        for i in range(4):
+            self.log({"i": i})
+        self.queue.get_nowait()
+        self.queue.get_nowait()
+        self.handler._report_interval = 0
+        self.log({"i": 4})
+        self.assertEqual(self.queued(), [{"i": 3}, {"i": 4}, {"dropped_records": 1}])
+
+        self.handler._report_interval = 1e9
+        self.log({"i": 5})
+        self.log({"i": 6})
+        self.log({"i": 7})
+        # i=3, i=4 and the report of 1 record were evicted
+        self.assertEqual(self.queued(), [{"i": 5}, {"i": 6}, {"i": 7}])
+        self.assertEqual(self.handler._dropped, 3)
+
+    def test_sentinel_never_evicted(self):
+        self.queue.put(None)
+        self.log({"i": 0})
+        self.log({"i": 1})
+        self.log({"i": 2})
+        self.assertIn(None, list(self.queue.queue))
+        self.assertEqual(self.handler._dropped, 1)
+
+    def test_closed(self):
+        self.handler.close()
+        self.log({"i": 0})
+        self.assertEqual(self.queued(), [])
+
+    def test_message_captured_at_log_time(self):
+        msg = {"i": 0}
+        self.log(msg)
+        msg["i"] = 1
+        self.assertEqual(self.queued(), [{"i": 0}])
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record.msg)
+
+
+class QueueListenerTest(unittest.TestCase):
+    def test_stop_several_listeners(self):
+        records = queue.Queue(5)
+        handlers = [_RecordingHandler() for _ in range(3)]
+        listeners = [
+            InfluxdbMonitorQueueListener(records, handler, flush_interval=0.01)
+            for handler in handlers
+        ]
+        for listener in listeners:
+            listener.start()
+        for i in range(100):
+            records.put(logging.makeLogRecord({"msg": i}))
+        # The queue may be full, enqueue_sentinel must wait for room
+        for listener in listeners:
+            listener.enqueue_sentinel()
+        for listener in listeners:
+            listener.join()
+
+        handled = sorted(msg for handler in handlers for msg in handler.records)
+        self.assertEqual(handled, list(range(100)))
+
+
+class _SlowHandler(_RecordingHandler):
+    def emit(self, record):
+        time.sleep(0.001)
+        super().emit(record)
+
+
+class HandlerCloseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        config = {
+            "queue_size": 4,
+            "port": 8086,
+            "database": "monitordb",
+            "use_udp": False,
+            "writer_num": 2,
+        }
+        with mock.patch.object(
+            influxdb_handler, "_get_config", return_value=config
+        ), mock.patch.object(
+            influxdb_handler,
+            "InfluxdbMonitorHandlerInner",
+            side_effect=lambda *args, **kwargs: _SlowHandler(),
+        ):
+            self.handler = InfluxdbMonitorHandler("127.0.0.1")
+
+    def test_close_while_logging(self):
+        listeners = list(self.handler._queue_listeners)
+        stop = threading.Event()
+
+        def produce():
+            i = 0
+            while not stop.is_set():
+                self.handler.handle(logging.makeLogRecord({"msg": {"i": i}}))
+                i += 1
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while not self.handler._queue.full():
+                time.sleep(0.001)
+            start = time.monotonic()
+            self.handler.close()
+            self.assertLess(time.monotonic() - start, 5.0)
+        finally:
+            stop.set()
+            producer.join()
+        for listener in listeners:
+            self.assertIsNone(listener._thread)
+        self.assertTrue(self.handler._queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()